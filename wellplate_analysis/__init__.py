@@ -1,6 +1,7 @@
 from .cli import main
 from .io import load_xlsx
-from .processing import handle_ovrflw, index_to_time, normalize_by_OD, rename_sample_columns, average_replicates, rename_and_average 
+from .processing import handle_ovrflw, index_to_time, normalize_by_OD, rename_sample_columns, average_replicates, rename_and_average
+from .plate import PlateData
 from .calibration import rfu_to_mefl, plot_calibration
 from .plotting import plot_columns
 from .run_pipeline import run_pipeline
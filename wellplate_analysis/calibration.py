@@ -1,10 +1,23 @@
 
 import pandas as pd
 import numpy as np
-import scipy.stats as ss
 import matplotlib.pyplot as plt
 import os
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _affine_transform(vals, slope, intercept, out):
+        # Fused multiply-add over the whole well matrix, parallelized across wells
+        for j in prange(vals.shape[1]):
+            for i in range(vals.shape[0]):
+                out[i, j] = vals[i, j] * slope + intercept
+
 def rfu_to_mefl(df, fluor_conc_uM, well_volume_uL, fluorescein_wells, background_well=False):
     """
     Converts column values from relative fluorescence units (RFUs) to molecules of equivalent fluorescein (MEFL) using 
@@ -28,23 +41,40 @@ def rfu_to_mefl(df, fluor_conc_uM, well_volume_uL, fluorescein_wells, background
     fluor_molecules = fluor_conc_uM * well_volume * avogadro
 
     # extract relative fluorescence units from dataframe associated with the above fluorescein concentrations
-    rfus = list(df[fluorescein_wells].mean().values)
-    
+    rfus = df[fluorescein_wells].mean().to_numpy()
+
     # Normalize to background (an empty well)
-    if background_well != False:
+    if background_well:
         rfus = rfus - df[background_well].mean()
 
-    # Linear regression
-    LR = ss.linregress(x=rfus, y=fluor_molecules)
-    intercept = LR.intercept
-    slope = LR.slope
-    r_squared = LR.rvalue**2
+    # Linear regression (closed-form least squares, cheaper than scipy for a handful of points)
+    x = rfus.astype(np.float64)
+    y = fluor_molecules
+    dx = x - x.mean()
+    dy = y - y.mean()
+    slope = (dx * dy).sum() / (dx * dx).sum()
+    intercept = y.mean() - slope * x.mean()
+    residuals = y - (slope * x + intercept)
+    r_squared = 1 - (residuals**2).sum() / (dy**2).sum()
 
     df_MEFL = df.copy()
-    for col in df_MEFL.columns:
-        if col.startswith('A') or col.startswith('B') or col.startswith('C') or col.startswith('D') or col.startswith('E') or col.startswith('F') or col.startswith('G') or col.startswith('H'):
-            df_MEFL.loc[:,col] = (df.loc[:,col]*slope) + intercept
-    
+    wells = df.attrs.get("wells")
+    # attrs survive rename/subsetting, so keep only well names the frame still has
+    # and fall back to the regex scan when the table no longer describes its columns
+    well_cols = wells.dropna().index.intersection(df.columns) if wells is not None else None
+    if well_cols is None or len(well_cols) == 0:
+        well_cols = df.columns[df.columns.str.match(r'^[A-H]')]
+    vals = df[well_cols].to_numpy(dtype=np.float64, copy=True)
+    if njit is not None:
+        mefl_vals = np.empty_like(vals)
+        _affine_transform(vals, slope, intercept, mefl_vals)
+    else:
+        # In-place multiply and add avoid the temporary that vals*slope + intercept would allocate
+        np.multiply(vals, slope, out=vals)
+        np.add(vals, intercept, out=vals)
+        mefl_vals = vals
+    df_MEFL[well_cols] = mefl_vals
+
     return df_MEFL, rfus, fluor_molecules, slope, intercept, r_squared
 
 
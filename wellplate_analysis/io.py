@@ -1,22 +1,70 @@
+import hashlib
+import os
+
 import pandas as pd
-import openpyxl as op
+import pyarrow as pa
+import pyarrow.csv
+from python_calamine import CalamineWorkbook
 
-def load_xlsx(file_path, sheet_name):
+def load_xlsx(file_path, sheet_name, cache_dir=None):
     """
-    Reads in time-course well plate data as an .xlsx file. 
+    Reads in time-course well plate data as an .xlsx file.
 
     Parameters:
         file_path: local path to the desired .xlsx file
         sheet_name: name of sheet containing relevant data
+        cache_dir: optional path to a folder for caching parsed sheets as Parquet.
+            Cache entries are keyed on the file path, sheet name, modification time,
+            and size, so re-running on an unchanged workbook skips the .xlsx parse.
 
     Returns:
-        pd.DataFrame: DataFrame containing the available data from the specified sheet of an Excel file 
+        pd.DataFrame: DataFrame containing the available data from the specified sheet of an Excel file
+    """
+
+    if cache_dir is not None:
+        stat = os.stat(file_path)
+        key = f"{os.path.abspath(file_path)}|{sheet_name}|{stat.st_mtime_ns}|{stat.st_size}"
+        cache_path = os.path.join(cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".parquet")
+    else:
+        cache_path = None
+
+    if cache_path is not None and os.path.exists(cache_path):
+        data = pd.read_parquet(cache_path, engine="pyarrow")
+    else:
+        workbook = CalamineWorkbook.from_path(file_path)
+        rows = workbook.get_sheet_by_name(sheet_name).to_python()
+        data = pd.DataFrame(rows[1:], columns=rows[0])
+        if cache_path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            try:
+                data.to_parquet(cache_path, engine="pyarrow")
+            except (ValueError, pa.ArrowInvalid):
+                # Sheets mixing numbers and strings (e.g. OVRFLW cells) in one column
+                # cannot round-trip through Arrow; skip caching those
+                pass
+
+    # Parse well coordinates once so downstream steps never rescan column names
+    data.attrs["wells"] = data.columns.to_series().str.extract(r'^([A-H])(\d{1,2})$').set_axis(["row", "column"], axis=1)
+    return data
+
+
+def write_csv(df, path):
     """
+    Write a DataFrame to a CSV file, keeping the index as the first column.
+
+    Uses pyarrow's C++ CSV writer, which encodes chunks in parallel and is
+    several times faster than pandas' to_csv; falls back to to_csv for frames
+    whose columns cannot be converted to Arrow.
 
-    workbook = op.load_workbook(file_path)
-    ws = workbook[sheet_name]
-    data = pd.DataFrame(ws.values)
-    workbook.close()
-    data.columns = data.iloc[0]
-    data = data[1:].reset_index(drop=True)
-    return data
\ No newline at end of file
+    Parameters:
+        df (pd.DataFrame): DataFrame to write
+        path: destination path for the CSV file
+    """
+    frame = df.reset_index()
+    frame.attrs = {}  # the well-coordinate table in attrs is not Arrow metadata
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+    except (ValueError, pa.ArrowInvalid):
+        df.to_csv(path)
+        return
+    pa.csv.write_csv(table, path)
@@ -0,0 +1,104 @@
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .processing import group_replicate_columns
+
+
+@dataclass
+class PlateData:
+    """
+    Structure-of-arrays container for a time-course well plate measurement.
+
+    Instead of a mixed-dtype DataFrame, the numeric well measurements live in one
+    contiguous float64 array of shape (ntime, nwells), alongside the well names and
+    the elapsed time in hours. Reductions along either axis then run as single
+    vectorized passes over the contiguous buffer with no per-column dispatch.
+
+    Attributes:
+        values (np.ndarray): float64 array of shape (ntime, nwells) with one column per well
+        well_names (np.ndarray): array of well/sample names, one per column of values
+        time_hours (np.ndarray): float64 array of elapsed hours, one per row of values
+    """
+    values: np.ndarray
+    well_names: np.ndarray
+    time_hours: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, df, replacement=np.nan):
+        """
+        Build a PlateData from a DataFrame as returned by io.load_xlsx, i.e. with a
+        "Time" column of time stamps, one metadata column, and one column per well.
+
+        Parameters:
+            df (pd.DataFrame): DataFrame with time-course well plate data
+            replacement: value to substitute for OVRFLW cells (default NaN)
+
+        Returns:
+            PlateData: contiguous float64 copy of the well measurements
+        """
+        df = df.dropna()
+        seconds = df["Time"].map(lambda t: t.hour * 3600 + t.minute * 60 + t.second).to_numpy()
+        well_block = df.iloc[:, 2:]
+        values = well_block.mask(well_block == "OVRFLW", replacement).to_numpy(dtype=np.float64)
+        return cls(
+            values=np.ascontiguousarray(values),
+            well_names=well_block.columns.to_numpy(),
+            time_hours=seconds / 3600.0,
+        )
+
+    def to_dataframe(self):
+        """
+        Convert back to a DataFrame with the elapsed hours as the index.
+
+        Returns:
+            pd.DataFrame: DataFrame with one column per well
+        """
+        return pd.DataFrame(
+            self.values,
+            index=pd.Index(self.time_hours, name="hours elapsed"),
+            columns=self.well_names,
+        )
+
+    def normalize_by(self, other):
+        """
+        Normalize these measurements by another plate (e.g. fluorescence by OD600).
+
+        Parameters:
+            other (PlateData): plate with the same shape and well layout
+
+        Returns:
+            PlateData: plate with values divided element-wise by other.values
+        """
+        return PlateData(
+            values=self.values / other.values,
+            well_names=self.well_names,
+            time_hours=self.time_hours,
+        )
+
+    def average_replicates(self, conditions):
+        """
+        Average replicate wells whose names share a condition-name prefix.
+
+        Parameters:
+            conditions: Iterable of condition names to bucket wells under.
+
+        Returns:
+            PlateData: plate with one column per condition
+        """
+        groups = group_replicate_columns(self.well_names, conditions)
+        col_index = {name: j for j, name in enumerate(self.well_names)}
+        averaged = np.empty((self.values.shape[0], len(groups)))
+        with warnings.catch_warnings():
+            # all-NaN timepoints average to NaN silently, matching the DataFrame path
+            warnings.filterwarnings("ignore", "Mean of empty slice", RuntimeWarning)
+            for j, cols in enumerate(groups.values()):
+                # nanmean so a NaN replicate (e.g. a replaced OVRFLW cell) drops out of the average
+                averaged[:, j] = np.nanmean(self.values[:, [col_index[c] for c in cols]], axis=1)
+        return PlateData(
+            values=averaged,
+            well_names=np.array(list(groups)),
+            time_hours=self.time_hours,
+        )
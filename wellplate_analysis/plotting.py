@@ -1,9 +1,11 @@
-import matplotlib.pyplot as plt
 import os
 
+import matplotlib.cm as cm
+from matplotlib.figure import Figure
+
 def plot_columns(df, columns, title, units, output_folder, filename="file_name.png", colors=None, labels=None ):
     """
-    Plots the specified columns from a time-course microwell plate experiment as line graphs. 
+    Plots the specified columns from a time-course microwell plate experiment as line graphs.
 
     Parameters:
         df (pd.DataFrame): DataFrame with sample-specific column names, may contain the following measurements:
@@ -25,17 +27,19 @@ def plot_columns(df, columns, title, units, output_folder, filename="file_name.p
     if labels is None:
         labels = columns
     if colors is None:
-        import matplotlib.cm as cm
         colors = cm.tab10.colors[:len(columns)]
 
-    plt.figure(figsize=(8,6))
-    for col, color, label in zip(columns, colors, labels):
-        plt.plot(df.index, df.loc[:,col], color=color, label=label, linewidth=1.2, alpha=1)
-    plt.title(title)
-    plt.xlabel("Time (hours)")
-    plt.ylabel(units)
+    # Standalone Figure skips the pyplot state machine; savefig renders through Agg
+    fig = Figure(figsize=(8,6))
+    ax = fig.subplots()
+    lines = ax.plot(df.index.to_numpy(), df.loc[:,columns].to_numpy(), linewidth=1.2, alpha=1)
+    for line, color, label in zip(lines, colors, labels):
+        line.set_color(color)
+        line.set_label(label)
+    ax.set_title(title)
+    ax.set_xlabel("Time (hours)")
+    ax.set_ylabel(units)
     os.makedirs(output_folder, exist_ok=True)
-    plt.savefig(os.path.join(output_folder, filename))
-    plt.close()
+    fig.savefig(os.path.join(output_folder, filename))
 
     return(df)
@@ -1,6 +1,7 @@
+import warnings
+
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
 
 def handle_ovrflw(df, integer=False):
     """
@@ -15,16 +16,13 @@ def handle_ovrflw(df, integer=False):
         integer (int): optional argument to specify what to replace OVRFLW cells with
 
     Returns:
-        pd.DataFrame: DataFrame with OVRFLW cells replaced with NA or a specified integer
+        pd.DataFrame: DataFrame with OVRFLW cells replaced with NaN or a specified integer, with the well columns cast to float64
     """
-    for j,col in enumerate(df.columns):
-        if j > 1:
-            for i in df.index:
-                if(df.iloc[i,j]=="OVRFLW"):
-                    if integer != False:
-                        df.iloc[i,j] = integer 
-                    else:
-                        df.iloc[i,j] = pd.NA
+    replacement = integer if integer != False else np.nan
+    sub = df.iloc[:, 2:]
+    sub = sub.mask(sub == "OVRFLW", replacement)
+    # Cast the well block to float64 so downstream arithmetic stays vectorized instead of falling back to object dtype
+    df[df.columns[2:]] = sub.apply(pd.to_numeric, errors="coerce").astype("float64")
     return df
 
 
@@ -38,17 +36,10 @@ def index_to_time(df):
     Returns:
         pd.DataFrame: DataFrame with the index set to an equivalent time for each row. 
     """
-    hours_elapsed = []
     df = df.dropna()
 
-    for time in df.loc[:,"Time"]:
-        hours, minutes, seconds = time.hour, time.minute, time.second
-        duration = timedelta(days=0,hours=hours,minutes=minutes,seconds=seconds)
-        total_hours = duration.total_seconds() / 3600
-        hours_elapsed.append(total_hours)
-    df["hours elapsed"] = hours_elapsed
-
-    df.set_index("hours elapsed", inplace=True)
+    seconds = df["Time"].map(lambda t: t.hour * 3600 + t.minute * 60 + t.second).to_numpy()
+    df = df.set_index(pd.Index(seconds / 3600.0, name="hours elapsed"))
 
     return df
 
@@ -63,9 +54,13 @@ def normalize_by_OD(df_od, df_fl):
         df_fl (pd.DataFrame): DataFrame with time-course fluorescence data with the exact same rows and columns as df_od
 
     Returns:
-        pd.DataFrame: DataFrame with optical density-normalized fluorescence for each column. 
+        pd.DataFrame: DataFrame with optical density-normalized fluorescence for each column. Wells with near-zero optical density come back as NaN rather than inf.
     """
-    df_norm = df_fl.iloc[:,2:]/df_od.iloc[:,2:]
+    fl_vals = df_fl.iloc[:,2:].to_numpy(dtype=np.float64)
+    od_vals = df_od.iloc[:,2:].to_numpy(dtype=np.float64)
+    # Divide on the raw buffers (rows/columns are known to match, no alignment needed) and guard near-zero ODs
+    norm = np.divide(fl_vals, od_vals, out=np.full_like(fl_vals, np.nan), where=(od_vals > 1e-6))
+    df_norm = pd.DataFrame(norm, index=df_fl.index, columns=df_fl.columns[2:])
     return df_norm
 
 
@@ -83,28 +78,54 @@ def rename_sample_columns(df, rename_map):
     return df.rename(columns=rename_map)
 
 
+def group_replicate_columns(columns, conditions):
+    """
+    Bucket replicate column names by the condition they belong to.
+
+    Parameters:
+        columns: Iterable of column names with sample names as a prefix (e.g. "condition-1").
+        conditions: Iterable of condition names to bucket columns under.
+
+    Returns:
+        dict: Mapping of condition name to the list of matching column names. Each column
+        is assigned to the longest condition name that prefixes it, so a condition whose
+        name is a prefix of another (e.g. "s1" and "s10") does not capture the other's replicates.
+    """
+    conditions = sorted(dict.fromkeys(conditions), key=len, reverse=True)
+    groups = {}
+    for col in columns:
+        for cond in conditions:
+            if col.startswith(cond):
+                groups.setdefault(cond, []).append(col)
+                break
+    return groups
+
+
 def average_replicates(df, conditions):
     """
     Average replicate columns based on the renamed condition names.
-    
+
     Parameters:
         df (pd.DataFrame): DataFrame with column names set to sample names.
-        rename_map (dict): Mapping of original well names to condition names.
-    
+        conditions: Iterable of condition names whose replicate columns should be averaged,
+            or a precomputed mapping of condition name to replicate column names as
+            returned by group_replicate_columns.
+
     Returns:
         pd.DataFrame: DataFrame with averaged columns for each condition.
     """
-    # Extract unique condition names
-    conditions = set(conditions)
-    df_avg = pd.DataFrame(index=df.index)
-
-    for cond in conditions:
-        # Select all columns that start with this condition name
-        replicate_cols = [col for col in df.columns if col.startswith(cond)]
-        if replicate_cols:
-            df_avg[cond] = df[replicate_cols].mean(axis=1)
-    
-    return df_avg
+    if isinstance(conditions, dict):
+        groups = conditions
+    else:
+        groups = group_replicate_columns(df.columns, conditions)
+    if not groups:
+        return pd.DataFrame(index=df.index)
+    # nanmean preserves pandas' skipna semantics: a NaN replicate (e.g. an OVRFLW cell) drops out instead of poisoning the average
+    with warnings.catch_warnings():
+        # timepoints where every replicate is NaN should average to NaN silently, as pandas does
+        warnings.filterwarnings("ignore", "Mean of empty slice", RuntimeWarning)
+        data = {cond: np.nanmean(df[cols].to_numpy(), axis=1) for cond, cols in groups.items()}
+    return pd.DataFrame(data, index=df.index)
 
 
 def rename_and_average(df, rename_map, conditions):
@@ -120,11 +141,5 @@ def rename_and_average(df, rename_map, conditions):
     """
     # Rename first
     df_renamed = df.rename(columns=rename_map)
-    conditions = set(conditions)
-    df_avg = pd.DataFrame(index=df.index)
-    for cond in conditions:
-        replicate_cols = [col for col in df_renamed.columns if col.startswith(cond)]
-        if replicate_cols:
-            df_avg[cond] = df_renamed[replicate_cols].mean(axis=1)
-    return df_avg
+    return average_replicates(df_renamed, conditions)
 
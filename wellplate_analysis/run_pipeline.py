@@ -1,24 +1,110 @@
 import yaml
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
-from .io import load_xlsx
-from .processing import handle_ovrflw, index_to_time, normalize_by_OD, rename_sample_columns, average_replicates 
+from .io import load_xlsx, write_csv
+from .processing import handle_ovrflw, index_to_time, normalize_by_OD, rename_sample_columns, average_replicates, group_replicate_columns
 from .calibration import rfu_to_mefl, plot_calibration
 from .plotting import plot_columns
 
 logging.basicConfig(level=logging.INFO,
                     format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Plot source names from the YAML config mapped to pipeline stage names
+_SOURCES = {
+    "normalized MEFL average": "norm_MEFL_avg",
+    "normalized MEFL replicates": "norm_MEFL",
+    "MEFL average": "MEFL_avg",
+    "MEFL replicates": "MEFL",
+    "normalized RFU average": "norm_sfGFP_avg",
+    "normalized RFU replicates": "norm_sfGFP",
+    "RFU average": "sfGFP_avg",
+    "RFU replicates": "sfGFP",
+    "OD average": "od600_avg",
+    "OD replicates": "od600",
+}
+
+# CSV filename for each derived stage that gets exported once computed
+_STAGE_EXPORTS = {
+    "norm_MEFL": "normalized_MEFL_replicates.csv",
+    "od600_avg": "OD_replicate_averages.csv",
+    "sfGFP_avg": "RFU_replicate_averages.csv",
+    "norm_sfGFP_avg": "normalized_RFU_replicate_averages.csv",
+    "MEFL_avg": "MEFL_replicate_averages.csv",
+    "norm_MEFL_avg": "normalized_MEFL_replicate_averages.csv",
+}
+
+
+class _PipelineStages:
+    """
+    Lazily computes and caches the derived frames a pipeline run actually uses.
+
+    Each derived stage is a cached_property, so it is computed at most once and
+    only when a requested plot (or the matching CSV export) first asks for it.
+    Stages that lack their prerequisites (no calibration, no conditions) come
+    back as None.
+    """
+
+    def __init__(self, od600, sfGFP, MEFL, groups):
+        self.od600 = od600
+        self.sfGFP = sfGFP
+        self.MEFL = MEFL
+        self.groups = groups
+
+    @cached_property
+    def norm_sfGFP(self):
+        return normalize_by_OD(self.od600, self.sfGFP)
+
+    @cached_property
+    def norm_MEFL(self):
+        if self.MEFL is None:
+            return None
+        return normalize_by_OD(self.od600, self.MEFL)
+
+    @cached_property
+    def od600_avg(self):
+        return self._average(self.od600)
+
+    @cached_property
+    def sfGFP_avg(self):
+        return self._average(self.sfGFP)
+
+    @cached_property
+    def norm_sfGFP_avg(self):
+        return self._average(self.norm_sfGFP)
+
+    @cached_property
+    def MEFL_avg(self):
+        return self._average(self.MEFL)
+
+    @cached_property
+    def norm_MEFL_avg(self):
+        return self._average(self.norm_MEFL)
+
+    def _average(self, df):
+        if df is None or not self.groups:
+            return None
+        return average_replicates(df, self.groups)
+
+    def computed(self, stage):
+        """Return the stage's frame if it has already been materialized, else None."""
+        if stage in ("od600", "sfGFP", "MEFL"):
+            return getattr(self, stage)
+        return self.__dict__.get(stage)
+
+
 def run_pipeline(config_path: str) -> dict:
     """
     Run full well plate analysis pipeline from a YAML config file.
-    Plots normalized MEFL (MEFL/OD600) over time for the specified plotting samples in a YAML config file.  
+    Plots normalized MEFL (MEFL/OD600) over time for the specified plotting samples in a YAML config file.
+    Only the stages referenced by the requested plots are computed and exported.
     """
     # Load config file
     with open(config_path, "r") as f:
         config = yaml.safe_load(f)
-    
+
     required_sections = ["file_path", "sheets", "rename_map", "plotting"]
     for section in required_sections:
         if section not in config:
@@ -30,8 +116,10 @@ def run_pipeline(config_path: str) -> dict:
     os.makedirs(output_folder, exist_ok=True)
 
     # Load data sheets for optical density (OD) and fluorescence (RFU) time-course data
-    df_od600 = load_xlsx(file_path, config["sheets"]["od600"])
-    df_sfGFP = load_xlsx(file_path, config["sheets"]["fluorescence"])
+    # Parsed sheets are cached so re-runs on an unchanged workbook skip the .xlsx parse
+    cache_dir = os.path.join(output_folder, ".cache")
+    df_od600 = load_xlsx(file_path, config["sheets"]["od600"], cache_dir=cache_dir)
+    df_sfGFP = load_xlsx(file_path, config["sheets"]["fluorescence"], cache_dir=cache_dir)
 
     if not df_od600.index.equals(df_sfGFP.index):
         raise ValueError("OD600 and fluorescence time axes do not match.")
@@ -62,7 +150,7 @@ def run_pipeline(config_path: str) -> dict:
         df_MEFL, RFU, MEFL, Slope, Intercept, R_squared = rfu_to_mefl(
             df_sfGFP, fluor_conc_uM, well_volume, fluor_wells, background
             )
-        df_MEFL.to_csv(os.path.join(output_folder, "MEFL.csv"))
+        write_csv(df_MEFL, os.path.join(output_folder, "MEFL.csv"))
         logging.info(f"MEFL data saved to {output_folder}/MEFL.csv")
 
         conversion_file = calibration_cfg["calibration_plot"]
@@ -85,71 +173,40 @@ def run_pipeline(config_path: str) -> dict:
 
     logging.info("Samples named.")
 
-    # Normalize RFU and MEFL data by optical density
-    df_norm_sfGFP = normalize_by_OD(df_od600, df_sfGFP)
-    logging.info("RFU normalized by optical density.")
+    # Bucket replicate columns once; all averaged frames share the same column layout
+    conditions = config.get("conditions", False)
+    groups = group_replicate_columns(df_od600.columns, conditions) if conditions else None
 
-    if df_MEFL is not None:
-        df_norm_MEFL = normalize_by_OD(df_od600, df_MEFL)
-        logging.info("MEFL normalized by optical density.")
+    stages = _PipelineStages(df_od600, df_sfGFP, df_MEFL, groups)
 
-        # locally save normalized MEFL data as CSV files
-        df_norm_MEFL.to_csv(os.path.join(output_folder, "normalized_MEFL_replicates.csv"))
-        logging.info(f"normalized MEFL data saved to {output_folder}/normalized_MEFL_replicates.csv")
+    plot_configs = config.get("plotting", {}).get("plots",[])
 
-    # Create dataframe of averages of technical replicates for fluorescence time-course measurements
-    df_od600_avg = None
-    df_sfGFP_avg = None
-    df_norm_sfGFP_avg = None
-    df_MEFL_avg = None
-    df_norm_MEFL_avg = None
+    # Materialize only the stages the requested plots reference. The stages are
+    # independent of one another, so compute them concurrently.
+    needed = {plot_cfg["source"] for plot_cfg in plot_configs}
+    unknown = needed - set(_SOURCES)
+    if unknown:
+        raise ValueError(f"Unknown plot sources requested: {sorted(unknown)}")
 
-    conditions = config.get("conditions", False)
-    if conditions:
-        df_od600_avg = average_replicates(df_od600, conditions)
-        df_od600_avg.to_csv(os.path.join(output_folder, "OD_replicate_averages.csv"))
-        logging.info(f"Averaged OD600 replicate data saved to {output_folder}/OD_replicate_averages.csv")
-        
-        df_sfGFP_avg = average_replicates(df_sfGFP, conditions)
-        df_sfGFP_avg.to_csv(os.path.join(output_folder, "RFU_replicate_averages.csv"))
-        logging.info(f"Averaged RFU replicate data saved to {output_folder}/RFU_replicate_averages.csv")
-
-        df_norm_sfGFP_avg = average_replicates(df_norm_sfGFP, conditions)
-        df_norm_sfGFP_avg.to_csv(os.path.join(output_folder, "normalized_RFU_replicate_averages.csv"))
-        logging.info(f"Averaged normalized RFU replicate data saved to {output_folder}/normalized_RFU_replicate_averages.csv")
-
-        if df_MEFL is not None:
-            df_MEFL_avg = average_replicates(df_MEFL, conditions)
-            df_MEFL_avg.to_csv(os.path.join(output_folder, "MEFL_replicate_averages.csv"))
-            logging.info(f"Averaged MEFL replicate data saved to {output_folder}/MEFL_replicate_averages.csv")
-
-
-        if df_norm_MEFL is not None:
-            df_norm_MEFL_avg = average_replicates(df_norm_MEFL, conditions)
-            df_norm_MEFL_avg.to_csv(os.path.join(output_folder, "normalized_MEFL_replicate_averages.csv"))
-            logging.info(f"Averaged normalized MEFL replicate data saved to {output_folder}/normalized_MEFL_replicate_averages.csv")
-        
-        logging.info("Technical replicates averaged.")
-    
-    # Plot
-    df_map = {
-        "normalized MEFL average": df_norm_MEFL_avg,
-        "normalized MEFL replicates": df_norm_MEFL,
-        "MEFL average": df_MEFL_avg,
-        "MEFL replicates": df_MEFL,
-        "normalized RFU average": df_norm_sfGFP_avg,
-        "normalized RFU replicates": df_norm_sfGFP,
-        "RFU average": df_sfGFP_avg,
-        "RFU replicates": df_sfGFP,
-        "OD average": df_od600_avg,
-        "OD replicates": df_od600
-    }
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {source: executor.submit(getattr, stages, _SOURCES[source]) for source in needed}
+        frames = {source: future.result() for source, future in futures.items()}
 
-    plot_configs = config.get("plotting", {}).get("plots",[])
+        # Export a CSV for every derived stage that was computed; the file writes
+        # overlap since write_csv releases the GIL for the I/O
+        exports = {name: frame for stage, name in _STAGE_EXPORTS.items()
+                   if (frame := stages.computed(stage)) is not None}
+        writes = [executor.submit(write_csv, frame, os.path.join(output_folder, name)) for name, frame in exports.items()]
+        for write in writes:
+            write.result()
 
+    for name in exports:
+        logging.info(f"Processed data saved to {output_folder}/{name}")
+
+    # Plot
     for plot_cfg in plot_configs:
         source = plot_cfg["source"]
-        df_to_plot = df_map.get(source)
+        df_to_plot = frames[source]
         if df_to_plot is None:
             raise ValueError(f"Plot source '{source}' requested but data not available")
 
@@ -159,7 +216,7 @@ def run_pipeline(config_path: str) -> dict:
             raise ValueError(
                 f"Columns {missing} not found in dataframe for plot '{plot_cfg['name']}'"
             )
-        
+
         plot_columns(
             df = df_to_plot,
             columns = columns,
@@ -175,12 +232,11 @@ def run_pipeline(config_path: str) -> dict:
     logging.info("Pipeline completed successfully.")
 
     return {
-    "normalized_MEFL_replicates": df_norm_MEFL,
-    "normalized_MEFL_average": df_norm_MEFL_avg,
+    "normalized_MEFL_replicates": stages.computed("norm_MEFL"),
+    "normalized_MEFL_average": stages.computed("norm_MEFL_avg"),
     "calibration": {
         "slope": Slope,
         "intercept": Intercept,
         "r_squared": R_squared
     }
     }
-    
\ No newline at end of file